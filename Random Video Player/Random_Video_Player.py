@@ -13,12 +13,29 @@ The main window is split into clickable zones for navigation and control:
 The control bar at the bottom of the main window has filters for orientation and max length.
 
 Video info is cached in local app data after the initial scan of a folder for faster subsequent 
-loading times. If a video is modified or a new file is added to a folder, the cache will be 
-updated with the new info.
+loading times. Files added, removed or renamed are picked up automatically via their directory's
+modification time; a video edited in place (which leaves the directory untouched) is only
+re-probed after Reload Folder.
 """
 
-import sys, os, random, subprocess, platform, shutil, math, cv2, json, time
+import sys, os, random, subprocess, platform, math, json, time, threading, array, errno, functools
+from concurrent.futures import ThreadPoolExecutor
 from colorama import Fore, Back, Style
+
+# orjson parses/serializes the multi-MB cache several times faster than the
+# stdlib; fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps_bytes(obj):
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
 from pathlib import Path
 from PyQt6.QtCore import (Qt, QUrl, QSettings, pyqtSignal, QTimer, QEvent,
     QSize, QSizeF, QRectF, QThread)
@@ -28,17 +45,28 @@ from PyQt6.QtWidgets import (QApplication, QStackedLayout, QWidget, QVBoxLayout,
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtGui import (QGuiApplication, QIcon, QAction, QFont, QPaintEvent, 
-    QPainter, QPalette, QPalette, QColor, QPainter)
+    QPainter, QPalette, QPalette, QColor, QPainter, QPixmapCache)
 
-# To be able to access resources when compiled with PyInstaller
+# To be able to access resources when compiled with PyInstaller.
+# _MEIPASS is fixed for the process lifetime, so the result is memoizable
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     if hasattr(sys, "_MEIPASS"):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+# QIcon(path) re-reads and re-rasterizes the SVG on every construction, so
+# hand out one shared instance per path
+def shared_icon(path, _cache={}):
+    icon = _cache.get(path)
+    if icon is None:
+        icon = _cache[path] = QIcon(path)
+    return icon
+
 def load_stylesheet(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    # Read as bytes and decode in one shot; faster than text-mode streaming
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
 
 stylesheet = load_stylesheet(resource_path("styles.qss"))
 
@@ -48,10 +76,15 @@ def get_cache_path():
         os.makedirs(folder, exist_ok=True)
         return os.path.join(folder, "media_info_cache.json")
 
+_VIDEO_EXTS = frozenset(('.mp4', '.mkv', '.avi', '.mov'))
+
+# Zero-padded 00..99 lookup; cheaper than an f-string format per component
+_TWO_DIGITS = [f"{i:02}" for i in range(100)]
+
 def normalize_path(path: str) -> str:
-    path = os.path.abspath(path)
-    path = os.path.normpath(path)
-    return path
+    # Callers pass paths rooted at an absolute scan folder, so normpath is
+    # enough; abspath would add a getcwd() syscall per call
+    return os.path.normpath(path)
 
 class VideoScanner(QThread):
     import subprocess
@@ -60,100 +93,445 @@ class VideoScanner(QThread):
     scanned = pyqtSignal(list)
     scanned_progress = pyqtSignal(int, int) # scanned_count, total_count
 
-    def __init__(self, folder, orientation, max_length, force_reload=False):
+    def __init__(self, folder, orientation, max_length, force_reload=False, cache=None, workers=None):
         super().__init__()
-        self.folder = folder
+        self.folder = os.path.abspath(folder)
         self.orientation = orientation
         self.max_length = max_length
         self.force_reload = force_reload
+        self.media_info_cache = cache
+        self.workers = workers if workers else (os.cpu_count() or 4) + 1
+        self._abort = threading.Event()
 
-        # Load cache if exists
         self.cache_path = get_cache_path()
-        if os.path.exists(self.cache_path):
-            with open(self.cache_path, "r") as f:
-                self.media_info_cache = json.load(f)
+        self.journal_path = self.cache_path + ".log"
+        self.folder_index_path = os.path.join(os.path.dirname(self.cache_path), "folder_index.json")
+
+    # Ask the scan to stop at the next checkpoint. Called from the GUI thread
+    # when another folder is selected mid-scan, so in-flight probe work isn't
+    # wasted on results nobody will use.
+    def abort(self):
+        self._abort.set()
+
+    # Load cache if exists. Called from run() so the (possibly multi-MB) JSON
+    # parse happens on the scanner thread, not on whoever constructs us.
+    def _load_cache(self):
+        # The player hands back the dict from the previous scan, so the JSON
+        # is only parsed once per session
+        if self.media_info_cache is not None:
+            self._journal_entries = 0
         else:
-            self.media_info_cache = {}    
+            # One bytes read handed to the parser beats text-mode streaming on
+            # multi-MB caches
+            if os.path.exists(self.cache_path):
+                self.media_info_cache = json_loads(Path(self.cache_path).read_bytes())
+            else:
+                self.media_info_cache = {}
+            self._replay_journal()
+
+        # Per-folder index of directory mtimes + file list from the last scan,
+        # used to skip the walk entirely when nothing has changed
+        if os.path.exists(self.folder_index_path):
+            self.folder_index = json_loads(Path(self.folder_index_path).read_bytes())
+        else:
+            self.folder_index = {}
+
+    # Apply entries journaled after the last full snapshot (e.g. from a scan
+    # that never finished). Corrupt trailing lines from an interrupted write
+    # are skipped.
+    def _replay_journal(self):
+        self._journal_entries = 0
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self.media_info_cache.update(entry)
+                self._journal_entries += 1
 
     def run(self):
         startTime = time.time()
-        video_extensions = ('.mp4', '.mkv', '.avi', '.mov')
+        self._load_cache()
         videos = []
 
-        # Count total video files first
-        total_videos = sum(
-            1 for root, dirs, files in os.walk(self.folder)
-            for file in files if file.lower().endswith(video_extensions)
-        )
-        scanned_count = 0
-
-        for root, dirs, files in os.walk(self.folder):
-            for file in files:
-                if file.lower().endswith(video_extensions):
-                    full = normalize_path(os.path.join(root, file))
-                    scanned_count += 1
-                    self.scanned_progress.emit(scanned_count, total_videos)
-
-                    # Add functionality: If a different folder is selected or reload is selected, stop the current scan
-
-                    mtime = os.path.getmtime(full)
-
-                    info = self.media_info_cache.get(full)
-
-                    #If force reload was selected or it's a new file or the file has been modified, update it in cache
-                    if self.force_reload or info is None or info.get("mtime") != mtime:
-                        duration = self.get_video_length(full)
-                        orientation = self.detect_orientation(full)
-                        info = {"duration": duration, "orientation": orientation, "mtime": mtime}
-                        self.media_info_cache[full] = info
-
-                    # Skip if orientation doesn't match
-                    if self.orientation != "All" and info["orientation"] != self.orientation:
-                        continue
-
-                    # If there is no max length, allow all lengths. if there is a max length, skip if video is longer
-                    if self.max_length == 0:
-                        pass
-                    elif info["duration"] > self.max_length:
-                        continue
-
-                    videos.append(full)
-
-        try:
-            with open(self.cache_path, "w") as f:
-                json.dump(self.media_info_cache, f)
-        except Exception as e:
-            print(f"Failed to save duration cache: {e}")
-
+        candidates = []
+        stale = []
+        pruned = False
+
+        index = self.folder_index.get(self.folder)
+        if not self.force_reload and index and self._dirs_unchanged(index["dirs"]):
+            # Folder structure unchanged since the last scan: reuse the stored
+            # file list instead of walking. O(n_dirs) stats instead of
+            # O(n_files).
+            for full, sig in index["files"].items():
+                candidates.append((full, sig))
+                info = self.media_info_cache.get(full)
+                if info is None or info.get("sig") != sig:
+                    stale.append((full, sig))
+            self.scanned_progress.emit(len(candidates) - len(stale), len(candidates))
+        else:
+            # Single pass: discover and process in one traversal, growing the
+            # progress bar total as new files are found
+            self._dir_mtimes = {}
+
+            # Previous scan's per-directory view: directories whose mtime is
+            # unchanged serve their listing from here without a re-scandir
+            self._prev_dirs = {}
+            self._prev_files_by_dir = {}
+            self._prev_subdirs = {}
+            if index and not self.force_reload:
+                self._prev_dirs = index["dirs"]
+                for f_path, f_mtime in index["files"].items():
+                    self._prev_files_by_dir.setdefault(os.path.dirname(f_path), {})[f_path] = f_mtime
+                for d in index["dirs"]:
+                    self._prev_subdirs.setdefault(os.path.dirname(d), []).append(d)
+
+            # Each cross-thread emit posts an event to the GUI thread, so
+            # throttle to every 64 files or ~30 Hz, whichever comes first
+            last_emit = 0.0
+            for full, sig in self._iter_videos(self.folder):
+                if self._abort.is_set():
+                    return
+                full = normalize_path(full)
+
+                candidates.append((full, sig))
+
+                info = self.media_info_cache.get(full)
+
+                #If force reload was selected or it's a new file or the file has been modified, probe it and update the cache
+                if self.force_reload or info is None or info.get("sig") != sig:
+                    stale.append((full, sig))
+
+                now = time.monotonic()
+                if (len(candidates) & 63) == 0 or now - last_emit > 0.033:
+                    self.scanned_progress.emit(len(candidates) - len(stale), len(candidates))
+                    last_emit = now
+            self.scanned_progress.emit(len(candidates) - len(stale), len(candidates))
+
+            # Drop cache entries for files deleted outside the app, so the
+            # cache stays proportional to the live library. Entries from other
+            # folders are kept.
+            seen = {full for full, sig in candidates}
+            prefix = normalize_path(self.folder) + os.sep
+            kept = {k: v for k, v in self.media_info_cache.items()
+                    if k in seen or not k.startswith(prefix)}
+            pruned = len(kept) != len(self.media_info_cache)
+            self.media_info_cache = kept
+
+            self.folder_index[self.folder] = {"dirs": self._dir_mtimes, "files": dict(candidates)}
+            try:
+                with open(self.folder_index_path, "wb") as f:
+                    f.write(json_dumps_bytes(self.folder_index))
+            except Exception as e:
+                print(f"Failed to save folder index: {e}")
+
+        # Probe stale files in parallel; ffprobe/cv2 spend most of their time
+        # in process spawn and container parsing, so threads scale well here
+        self._probe_count = len(candidates) - len(stale)
+        self._probe_total = len(candidates)
+        self._probe_lock = threading.Lock()
+        self._last_probe_emit = 0.0
+        if stale:
+            # New entries go to an append-only journal as they arrive, so
+            # probing work survives a cancelled or crashed scan and each scan
+            # only writes O(new files) instead of rewriting the whole cache
+            journal = open(self.journal_path, "a")
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+            try:
+                for full, info in pool.map(self._probe, stale):
+                    if self._abort.is_set():
+                        break
+                    self.media_info_cache[full] = info
+                    journal.write(json.dumps({full: info}) + "\n")
+                    self._journal_entries += 1
+                    if self._journal_entries % 100 == 0:
+                        journal.flush()
+            finally:
+                # On abort, drop the queued probes instead of draining them
+                pool.shutdown(wait=False, cancel_futures=True)
+                journal.close()
+            if self._abort.is_set():
+                return
+            # Final update so the bar always lands on 100%
+            self.scanned_progress.emit(self._probe_count, self._probe_total)
+
+        # Filter over parallel arrays instead of per-item dict-of-dict lookups;
+        # repeated filter changes only touch these, never the cache dicts
+        cache = self.media_info_cache
+        paths = [full for full, sig in candidates]
+        # Kept for the player: filter toggles re-run against these in memory
+        # instead of rescanning the disk
+        self.candidate_paths = paths
+        durations = array.array('d', (cache[full]["duration"] for full in paths))
+        orientations = [cache[full]["orientation"] for full in paths]
+
+        want = self.orientation
+        max_length = self.max_length
+        for i, full in enumerate(paths):
+            # Skip if orientation doesn't match
+            if want != "All" and orientations[i] != want:
+                continue
+
+            # If there is no max length, allow all lengths. if there is a max length, skip if video is longer
+            if max_length != 0 and durations[i] > max_length:
+                continue
+
+            videos.append(full)
+
+        # Compact the journal into a full snapshot once it has grown past a
+        # tenth of the cache; below that the journal alone carries the delta.
+        # Pruned entries only disappear via a snapshot, so always compact then.
+        if pruned or (self._journal_entries and self._journal_entries * 10 >= len(self.media_info_cache)):
+            try:
+                # Write-to-temp then rename, so a crash mid-write can't
+                # truncate the snapshot
+                tmp_path = self.cache_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(json_dumps_bytes(self.media_info_cache))
+                os.replace(tmp_path, self.cache_path)
+                open(self.journal_path, "w").close()
+            except Exception as e:
+                print(f"Failed to save duration cache: {e}")
+
+        # Shuffle here so the GUI thread receives a ready-to-play queue
+        random.shuffle(videos)
         self.scanned.emit(videos)
         endTime = time.time()
         print(Fore.GREEN + "Loading folder duration:" + Style.RESET_ALL, endTime - startTime)
 
-    # Returns video length in seconds using ffprobe.
-    def get_video_length(self, path):
+    # Probe one stale file. Runs on a worker thread, so the progress counter
+    # is guarded by a lock.
+    def _probe(self, item):
+        full, sig = item
+        duration, orientation = self.probe_media_info(full)
+        with self._probe_lock:
+            self._probe_count += 1
+            now = time.monotonic()
+            if now - self._last_probe_emit > 0.033:
+                self.scanned_progress.emit(self._probe_count, self._probe_total)
+                self._last_probe_emit = now
+        return full, {"duration": duration, "orientation": orientation, "sig": sig}
+
+    # Directory mtimes change when entries are added, removed or renamed, so
+    # an unchanged set of directories means the stored file list still holds.
+    def _dirs_unchanged(self, dir_mtimes):
+        try:
+            for d, mtime_ns in dir_mtimes.items():
+                if os.stat(d).st_mtime_ns != mtime_ns:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    # Recursively walk a folder with os.scandir, yielding
+    # (path, [mtime, size]) — the signature cache entries are validated
+    # against. Size catches edits that preserve mtime; both come from the
+    # one DirEntry stat.
+    # Directories whose mtime matches the previous scan serve their listing
+    # from the stored index without touching the disk beyond one stat.
+    # DirEntry type checks reuse the readdir-provided info, so no extra stat
+    # call is made per entry.
+    def _iter_videos(self, folder, dir_mtime_ns=None):
+        if dir_mtime_ns is None:
+            try:
+                dir_mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                return
+        self._dir_mtimes[folder] = dir_mtime_ns
+
+        if self._prev_dirs.get(folder) == dir_mtime_ns:
+            yield from self._prev_files_by_dir.get(folder, {}).items()
+            for sub in self._prev_subdirs.get(folder, ()):
+                yield from self._iter_videos(sub)
+            return
+
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._iter_videos(entry.path, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    elif entry.is_file(follow_symlinks=False):
+                        # Lowercase only the suffix and test set membership,
+                        # instead of lowercasing the whole name for a 4-tuple
+                        # endswith
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot >= 0 and name[dot:].lower() in _VIDEO_EXTS:
+                            st = entry.stat()
+                            yield entry.path, [st.st_mtime, st.st_size]
+        except OSError:
+            pass
+
+    # Returns video length in seconds and orientation. MP4/MOV headers are
+    # parsed in-process (a few KB of reads); everything else, or a file whose
+    # header doesn't parse, goes through ffprobe.
+    def probe_media_info(self, path):
+        if path.lower().endswith(('.mp4', '.mov')):
+            info = self._probe_mp4(path)
+            if info is not None:
+                return info
+        return self._probe_ffprobe(path)
+
+    # Walk the top-level MP4 boxes for 'moov', then pull duration/timescale
+    # from mvhd and display size from the first video tkhd. Returns None when
+    # anything doesn't parse, so the caller can fall back to ffprobe.
+    def _probe_mp4(self, path):
+        try:
+            with open(path, "rb") as f:
+                file_size = os.fstat(f.fileno()).st_size
+                offset = 0
+                moov = None
+                # A valid file has a handful of top-level boxes; a malformed
+                # one decoding as endless 8-byte boxes must not wedge a pool
+                # worker, so bail to the ffprobe fallback past a sane cap
+                boxes = 0
+                while offset + 8 <= file_size:
+                    boxes += 1
+                    if boxes > 64:
+                        return None
+                    f.seek(offset)
+                    header = f.read(16)
+                    size = int.from_bytes(header[0:4], "big")
+                    box_type = header[4:8]
+                    header_len = 8
+                    if size == 1:  # 64-bit box size
+                        size = int.from_bytes(header[8:16], "big")
+                        header_len = 16
+                    elif size == 0:  # box extends to end of file
+                        size = file_size - offset
+                    if size < header_len:
+                        return None
+                    if box_type == b"moov":
+                        f.seek(offset + header_len)
+                        moov = f.read(size - header_len)
+                        break
+                    offset += size
+            if moov is None:
+                return None
+
+            duration = self._mp4_duration(moov)
+            dims = self._mp4_dimensions(moov)
+            if duration is None or dims is None:
+                return None
+            w, h = dims
+            if w > h:
+                return duration, "Horizontal"
+            return duration, "Vertical"
+        except Exception:
+            return None
+
+    def _mp4_duration(self, moov):
+        i = moov.find(b"mvhd")
+        if i < 0:
+            return None
+        version = moov[i + 4]
+        if version == 1:
+            timescale = int.from_bytes(moov[i + 24:i + 28], "big")
+            duration = int.from_bytes(moov[i + 28:i + 36], "big")
+        else:
+            timescale = int.from_bytes(moov[i + 16:i + 20], "big")
+            duration = int.from_bytes(moov[i + 20:i + 24], "big")
+        if timescale == 0:
+            return None
+        if duration == 0:
+            # Fragmented MP4s (OBS, DASH) keep mvhd duration at 0 and store
+            # the real value in the fragments; let ffprobe report it
+            return None
+        return duration / timescale
+
+    def _mp4_dimensions(self, moov):
+        # Width/height sit in the last 8 bytes of tkhd as 16.16 fixed point.
+        # Audio tracks report 0x0, so keep looking until a video track shows up.
+        j = moov.find(b"tkhd")
+        while j >= 0:
+            version = moov[j + 4]
+            base = j + 92 if version == 1 else j + 80
+            w = int.from_bytes(moov[base:base + 4], "big") >> 16
+            h = int.from_bytes(moov[base + 4:base + 8], "big") >> 16
+            if w and h:
+                # Phone recordings store the coded landscape size here and
+                # express orientation through the 36-byte composition matrix
+                # just before it: a 90/270 rotation has a == d == 0 with
+                # b and c nonzero, which swaps the display axes
+                m = base - 36
+                a = int.from_bytes(moov[m:m + 4], "big", signed=True)
+                b = int.from_bytes(moov[m + 4:m + 8], "big", signed=True)
+                c = int.from_bytes(moov[m + 12:m + 16], "big", signed=True)
+                d = int.from_bytes(moov[m + 16:m + 20], "big", signed=True)
+                if a == 0 and d == 0 and b and c:
+                    w, h = h, w
+                return w, h
+            j = moov.find(b"tkhd", j + 4)
+        return None
+
+    def _probe_ffprobe(self, path):
         try:
             cmd = [
                 "ffprobe",
                 "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=width,height:stream_tags=rotate:stream_side_data=rotation:format=duration",
+                "-of", "json",
                 path
             ]
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
-            return float(result.stdout.strip())
+            # Bounded timeout so one corrupt file can't wedge the scan, and
+            # no console window flash per probe on Windows
+            kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL, "text": True, "timeout": 10}
+            if os.name == "nt":
+                kwargs["creationflags"] = 0x08000000  # CREATE_NO_WINDOW
+            result = subprocess.run(cmd, **kwargs)
+            data = json.loads(result.stdout)
+            duration = float(data["format"]["duration"])
+            stream = data["streams"][0]
+            w = stream.get("width", 0)
+            h = stream.get("height", 0)
+            # Rotated streams store pre-rotation dimensions; swap so portrait
+            # phone recordings classify as Vertical
+            rotation = int(stream.get("tags", {}).get("rotate", 0))
+            for side_data in stream.get("side_data_list", []):
+                if "rotation" in side_data:
+                    rotation = int(side_data["rotation"])
+            if rotation % 180 != 0:
+                w, h = h, w
         except Exception:
-            return 999999  # treat un-readable files as too long
-    
-    def detect_orientation(self, path):
-        cap = cv2.VideoCapture(path)
-        w = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-        h = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-        cap.release()
+            return 999999, "Vertical"  # treat un-readable files as too long
         if w > h:
-            return "Horizontal"
-        elif h >= w:
-            return "Vertical"
-        return "All"
+            return duration, "Horizontal"
+        return duration, "Vertical"
+
+# QSettings goes to the registry (Windows) or disk for every value() and
+# setValue(); serve reads from a dict loaded once and write only the keys
+# that actually changed back on exit
+class CachedSettings:
+    def __init__(self, qsettings):
+        self._qs = qsettings
+        self._cache = {k: qsettings.value(k) for k in qsettings.allKeys()}
+        self._dirty = set()
+        # Coalesce bursts of setValue calls into one flush half a second
+        # after the last write, so changes survive a crash without paying a
+        # sync per call
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(500)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def value(self, key, default=None):
+        return self._cache.get(key, default)
+
+    def setValue(self, key, val):
+        if self._cache.get(key) != val:
+            self._cache[key] = val
+            self._dirty.add(key)
+            self._flush_timer.start()
+
+    def flush(self):
+        for key in self._dirty:
+            self._qs.setValue(key, self._cache[key])
+        self._dirty.clear()
+
 
 class LoadingOverlay(QWidget):
     def __init__(self, parent=None):
@@ -171,7 +549,6 @@ class LoadingOverlay(QWidget):
         self.loading_progress_bar.setMaximum(100)
         self.loading_progress_bar.setTextVisible(True)
         self.loading_progress_bar.setFixedWidth(200)
-        self.loading_progress_bar.setStyleSheet(stylesheet)
 
         self.layout.addWidget(self.loading_progress_bar)
 
@@ -198,21 +575,18 @@ class ControlsOverlay(QWidget):
         self.loop_btn = QPushButton()
         self.loop_btn.setObjectName("playOptions")
         self.loop_btn.setCheckable(True)
-        self.loop_btn.setIcon(QIcon(self.loop_off_icon))
+        self.loop_btn.setIcon(shared_icon(self.loop_off_icon))
         self.loop_btn.setIconSize(QSize(22, 22))
-        self.loop_btn.setStyleSheet(stylesheet)
         self.loop_enabled = False
 
         self.mute_btn = QPushButton()
         self.mute_btn.setObjectName("playOptions")
         self.mute_btn.setCheckable(True)
-        self.mute_btn.setIcon(QIcon(self.volume_on_icon))
+        self.mute_btn.setIcon(shared_icon(self.volume_on_icon))
         self.mute_btn.setIconSize(QSize(22, 22))
-        self.mute_btn.setStyleSheet(stylesheet)
 
         self.volume_slider = ClickableSlider(Qt.Orientation.Horizontal)
-        self.volume_slider.setObjectName("not-minimum")
-        self.volume_slider.setStyleSheet(stylesheet)
+        self.volume_slider.setProperty("empty", False)
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setFixedWidth(100)
         self.volume_slider.setFixedHeight(15)
@@ -220,44 +594,38 @@ class ControlsOverlay(QWidget):
         self.volume_slider_stored = 50 # Default value
 
         self.orientation_label = QLabel("Orientation:")
-        self.orientation_label.setStyleSheet(stylesheet)
         self.orientation_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         self.orientation_dropdown = QComboBox()
         self.orientation_dropdown.addItems(["Vertical", "Horizontal", "All"])
         self.orientation_dropdown.setCurrentText("All")
-        self.orientation_dropdown.setStyleSheet(stylesheet)
         self.orientation_dropdown.currentTextChanged.connect(self.on_orientation_changed)
         self.current_orientation = self.orientation_dropdown.currentText()
         self.pending_orientation = self.current_orientation
 
         self.max_length_label = QLabel("Max Length:")
-        self.max_length_label.setStyleSheet(stylesheet)
         self.max_length_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
         self.max_len_dec_btn = QPushButton("▼")
         self.max_len_dec_btn.setObjectName("max_len")
         self.max_len_dec_btn.setFixedWidth(25)
         self.max_len_dec_btn.setFixedHeight(12)
-        self.max_len_dec_btn.setStyleSheet(stylesheet)
 
         self.max_len_input = QLineEdit("None")
         self.max_len_input.setFixedWidth(35)
         self.max_len_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.max_len_input.setStyleSheet(stylesheet)
+        # editingFinished fires once on Enter/focus-out, so typing doesn't
+        # re-run the parse per keystroke and setText can't re-enter the slot
+        self.max_len_input.editingFinished.connect(
+            lambda: self.manual_max_length_changed(self.max_len_input.text()))
 
         self.max_len_inc_btn = QPushButton("▲")
         self.max_len_inc_btn.setObjectName("max_len")
         self.max_len_inc_btn.setFixedWidth(25)
         self.max_len_inc_btn.setFixedHeight(12)
-        self.max_len_inc_btn.setStyleSheet(stylesheet)   
-
-        self.max_len_delay_timer = QTimer()
-        self.max_len_delay_timer.setSingleShot(True)
-        self.max_len_delay_timer.setInterval(1000)  # 1 sec delay
-        self.max_len_delay_timer.timeout.connect(self.start_auto_max_length_timer)
 
+        # One timer covers both the hold delay and the auto-repeat: it starts
+        # at 1s and drops to 150ms on its first tick
         self.max_len_auto_timer = QTimer()
-        self.max_len_auto_timer.setInterval(150)  # auto-change interval
         self.max_len_auto_timer.timeout.connect(self._auto_change_max_length)
         self._max_len_change_direction = 0  # +1 for increment, -1 for decrement
 
@@ -269,18 +637,19 @@ class ControlsOverlay(QWidget):
         self.current_max_length = 0
         self.pending_max_length = 0
         self.duration_ms = 0
+        self._duration_str = "00:00"
+        self._last_sec_shown = -1
+        self._last_progress_val = -1
 
         # Progress bar + time
         self.progress_slider = ClickableSlider(Qt.Orientation.Horizontal)
-        self.progress_slider.setObjectName("minimum")
-        self.progress_slider.setStyleSheet(stylesheet)
+        self.progress_slider.setProperty("empty", True)
         self.progress_slider.setRange(0, 1000)
         self.progress_slider.setFixedHeight(12)
         self.progress_slider.valueChanged.connect(self.update_progress_slider_visibility)
 
         self.time_label = QLabel("00:00 / 00:00")
         self.max_len_inc_btn.setObjectName("time_label")
-        self.time_label.setStyleSheet(stylesheet)
 
         max_len_btn_layout = QVBoxLayout()
         max_len_btn_layout.setSpacing(1)
@@ -324,17 +693,31 @@ class ControlsOverlay(QWidget):
 
     def update_video_duration(self, dur):        
         self.duration_ms = dur
+        self._duration_str = self.format_time(dur)
+        self._last_sec_shown = -1
 
+    # positionChanged fires many times a second but the visible text only
+    # changes once a second, so skip the setText/setValue when nothing moved
     def update_video_progress(self, pos):        
         if self.duration_ms > 0:
-            val = int(pos / self.duration_ms * 1000)
-            self.progress_slider.setValue(val)
-        self.time_label.setText(f"{self.format_time(pos)} / {self.format_time(self.duration_ms)}")
+            val = (pos * 1000) // self.duration_ms
+            if val != self._last_progress_val:
+                self._last_progress_val = val
+                self.progress_slider.blockSignals(True)
+                self.progress_slider.setValue(val)
+                self.progress_slider.blockSignals(False)
+                self.update_progress_slider_visibility(val)
+        sec = pos // 1000
+        if sec != self._last_sec_shown:
+            self._last_sec_shown = sec
+            self.time_label.setText(f"{self.format_time(pos)} / {self._duration_str}")
 
     def format_time(self, ms):
         sec = ms // 1000
         m = sec // 60
         s = sec % 60
+        if m < 100:
+            return _TWO_DIGITS[m] + ":" + _TWO_DIGITS[s]
         return f"{m:02}:{s:02}"
 
     def set_max_length(self, value):        
@@ -360,35 +743,35 @@ class ControlsOverlay(QWidget):
     def start_max_len_hold(self, direction):        
         self._max_len_change_direction = direction
         self.change_max_length(direction)
-        self.max_len_delay_timer.start()
-
-    def start_auto_max_length_timer(self):        
+        self.max_len_auto_timer.setInterval(1000)  # 1 sec delay before repeating
         self.max_len_auto_timer.start()
 
     def stop_max_len_hold(self):        
-        self.max_len_delay_timer.stop()
         self.max_len_auto_timer.stop()
 
     def _auto_change_max_length(self):        
+        self.max_len_auto_timer.setInterval(150)  # auto-change interval
         self.change_max_length(self._max_len_change_direction)
 
     def change_max_length(self, direction):        
         new_value = self.pending_max_length + (10 * direction)
         self.set_max_length(new_value)
 
+    # Flip the "empty" style property only when it actually changes and
+    # repolish just that slider; re-applying the stylesheet forced a full QSS
+    # reparse on every tick
     def update_volume_slider_visibility(self, value):
-        if value == self.volume_slider.minimum():
-            self.volume_slider.setObjectName("minimum")
-        else:
-            self.volume_slider.setObjectName("not-minimum")
-        self.volume_slider.setStyleSheet(stylesheet)
+        self._update_slider_empty(self.volume_slider, value)
 
     def update_progress_slider_visibility(self, value):
-        if value == self.progress_slider.minimum():
-            self.progress_slider.setObjectName("minimum")
-        else:
-            self.progress_slider.setObjectName("not-minimum")
-        self.progress_slider.setStyleSheet(stylesheet)
+        self._update_slider_empty(self.progress_slider, value)
+
+    def _update_slider_empty(self, slider, value):
+        empty = value == slider.minimum()
+        if slider.property("empty") != empty:
+            slider.setProperty("empty", empty)
+            slider.style().unpolish(slider)
+            slider.style().polish(slider)
 
 class ClickOverlay(QWidget):
     clickedLeft = pyqtSignal()
@@ -398,95 +781,72 @@ class ClickOverlay(QWidget):
     clickedTop = pyqtSignal() 
     clickedBottom = pyqtSignal() 
     
-    # We'll use a single-click/double-click detector logic similar to the old frame
+    # Qt folds the second press of a double click into mouseDoubleClickEvent,
+    # so single clicks dispatch immediately instead of waiting out a timer
     def __init__(self, parent=None):   
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAutoFillBackground(False)
         self.setStyleSheet("background-color: transparent;")
-        
-        # === TIMER #1: delayed single click (~200 ms) ===
-        self._single_delay_timer = QTimer()
-        self._single_delay_timer.setSingleShot(True)
-        self._single_delay_timer.timeout.connect(self._emit_delayed_single)
-
-        # === TIMER #2: double-click window (~400 ms) ===
-        self._double_timeout_timer = QTimer()
-        self._double_timeout_timer.setSingleShot(True)
-        self._double_timeout_timer.timeout.connect(self._reset_double_click)
-
-        # states
-        self._waiting_single = False
-        self._waiting_double = False
-        
-        # tunable timings (from your original code)
-        self.single_delay_ms = 200
-        self.double_timeout_ms = 400
+        self._x1 = self._x2 = self._y1 = self._y2 = 0
+
+    # Zone boundaries only move on resize, so precompute them once here
+    # instead of dividing per click. 1/6 of the height for top/bottom
+    # zones, thirds for left/right.
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        w, h = self.width(), self.height()
+        self._x1 = w // 3
+        self._x2 = 2 * w // 3
+        self._y1 = h // 6
+        self._y2 = h - h // 6
+
+    def _zone(self, event):
+        x = event.position().x()
+        y = event.position().y()
+
+        if y < self._y1:
+            return "top"
+        if y > self._y2:
+            return "bottom"
+        if x < self._x1:
+            return "left"
+        if x >= self._x2:
+            return "right"
+        return "middle"
 
     def mousePressEvent(self, event):
-        # Only handle left clicks for navigation/control
+        # Only handle left clicks for navigation/control. For non-handled
+        # events (like Right Click), let the base class handle them (e.g.,
+        # context menu)
         if event.button() != Qt.MouseButton.LeftButton:
             super().mousePressEvent(event)
             return
 
-        w = self.width()
-        h = self.height()
-        x = event.position().x()
-        y = event.position().y()
-        
-        third_w = w / 3
-        # Use 1/5 (20%) of the height for top/bottom zones
-        sixth_h = h / 6 
-
-        if y < sixth_h:
+        zone = self._zone(event)
+        if zone == "top":
             self.clickedTop.emit()
-            return
-  
-        if y > h - sixth_h:
+        elif zone == "bottom":
             self.clickedBottom.emit()
-            return
-
-        if x < third_w:
+        elif zone == "left":
             self.clickedLeft.emit()
-            return
-
-        if x >= 2 * third_w:
+        elif zone == "right":
             self.clickedRight.emit()
-            return
-
-        if not self._waiting_double:
-            self._waiting_double = True
-            self._waiting_single = True
-
-            self._single_delay_timer.start(self.single_delay_ms)
-            self._double_timeout_timer.start(self.double_timeout_ms)
-            return
-
         else:
-            if self._waiting_single:
-                self._single_delay_timer.stop()
-                self._waiting_single = False
-            else:
-                self.clickedMiddle.emit()
-
-            self.doubleClickedMiddle.emit()
+            self.clickedMiddle.emit()
 
-            self._waiting_double = False
-            self._double_timeout_timer.stop()
+    def mouseDoubleClickEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            super().mouseDoubleClickEvent(event)
             return
-            
-        # For non-handled events (like Right Click), let the base class handle them (e.g., context menu)
-        super().mousePressEvent(event)
-
-    def _emit_delayed_single(self):
-        if self._waiting_single:
-            self.clickedMiddle.emit()
-            self._waiting_single = False
 
-    def _reset_double_click(self):
-        self._waiting_double = False
-        self._waiting_single = False
+        # Only the middle zone has a double-click action; elsewhere a rapid
+        # second click just repeats the single-click behavior
+        if self._zone(event) == "middle":
+            self.doubleClickedMiddle.emit()
+        else:
+            self.mousePressEvent(event)
 
 class ClickableSlider(QSlider):
     def mousePressEvent(self, event):
@@ -503,13 +863,13 @@ class VideoPlayer(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        self.settings = QSettings("RandomVideoPlayer", "Settings")
+        self.settings = CachedSettings(QSettings("RandomVideoPlayer", "Settings"))
 
         self.resize(800, 900)
         self.setMinimumSize(500,450)
 
-        video_widget = QVideoWidget(self)
-        self.setCentralWidget(video_widget)
+        self.video_widget = QVideoWidget(self)
+        self.setCentralWidget(self.video_widget)
 
         self.controls = ControlsOverlay(self)
 
@@ -518,7 +878,12 @@ class VideoPlayer(QMainWindow):
         self.mediaPlayer = QMediaPlayer()
         self.audioOutput = QAudioOutput()
         self.mediaPlayer.setAudioOutput(self.audioOutput)
-        self.mediaPlayer.setVideoOutput(video_widget)
+        self.mediaPlayer.setVideoOutput(self.video_widget)
+
+        # Second player preloads the next queued video in the background, so
+        # next_video swaps in an already-buffered pipeline instead of paying
+        # the full open/probe/buffer cost on click
+        self._standby_player = QMediaPlayer()
 
         self.click_overlay = ClickOverlay(self)
         self.click_overlay.clickedLeft.connect(self.previous_video)
@@ -528,58 +893,79 @@ class VideoPlayer(QMainWindow):
         self.click_overlay.clickedTop.connect(self.exit_fullscreen)
         self.click_overlay.clickedBottom.connect(self.toggle_controls_visibility)
 
-        self.mediaPlayer.positionChanged.connect(self.controls.update_video_progress)
-        self.mediaPlayer.durationChanged.connect(self.controls.update_video_duration)
+        # The backend emits positionChanged at its own cadence (often per
+        # frame); a fixed 5 Hz poll is plenty for a 1000-step slider and
+        # bounds the per-second UI work regardless of the media engine
+        self._ui_tick = QTimer(self)
+        self._ui_tick.setInterval(200)
+        self._ui_tick.timeout.connect(self._on_ui_tick)
+
+        self._connect_player(self.mediaPlayer)
         self.controls.progress_slider.sliderReleased.connect(self.seek_video)
-        self.mediaPlayer.mediaStatusChanged.connect(self.media_finished)
 
         self.video_list = []
+        self._video_urls = []
+        self._scanned_paths = None
         self.current_index = -1
+
+        # Shows the loading overlay only if a scan takes longer than a second
+        self.loader_timer = QTimer(self)
+        self.loader_timer.setSingleShot(True)
+        self.loader_timer.timeout.connect(self.show_loader)
         self.current_video_path = None
+        self.media_info_cache = None  # loaded by the first scan, then resident
+        self._pending_volume = None
         
-        self.check_box_unfilled_icon = QIcon(resource_path(os.path.join("icons", "square.svg")))
-        self.check_box_filled_icon = QIcon(resource_path(os.path.join("icons", "square-filled.svg")))
+        self.check_box_unfilled_icon = shared_icon(resource_path(os.path.join("icons", "square.svg")))
+        self.check_box_filled_icon = shared_icon(resource_path(os.path.join("icons", "square-filled.svg")))
+
+        # QIcon re-parses the SVG every time it's constructed, so build each
+        # button icon once and reuse it
+        self.loop_on_qicon = shared_icon(self.controls.loop_on_icon)
+        self.loop_off_qicon = shared_icon(self.controls.loop_off_icon)
+        self.volume_on_qicon = shared_icon(self.controls.volume_on_icon)
+        self.volume_off_qicon = shared_icon(self.controls.volume_off_icon)
+        self._last_loop_icon_state = None
+        self._last_mute_icon_state = None
 
         # Context Menu Actions
         self.mute_action = QAction("Mute", self)
         self.mute_action.setCheckable(True)
         self.mute_action.toggled.connect(self.toggle_mute)
-        self.mute_action.toggled.connect(self.update_mute_check_icon)
+        self.mute_action.toggled.connect(functools.partial(self._set_check_icon, self.mute_action))
 
         self.loop_action = QAction("Loop", self)
         self.loop_action.setCheckable(True)
         self.loop_action.toggled.connect(self.toggle_loop)
-        self.loop_action.toggled.connect(self.update_loop_check_icon)
+        self.loop_action.toggled.connect(functools.partial(self._set_check_icon, self.loop_action))
 
         self.auto_play_action = QAction("Auto Play", self)
         self.auto_play_action.setCheckable(True)
         self.auto_play_action.toggled.connect(self.toggle_auto_play)
-        self.auto_play_action.toggled.connect(self.update_auto_play_check_icon)
+        self.auto_play_action.toggled.connect(functools.partial(self._set_check_icon, self.auto_play_action, invert=True))
         self.auto_play_enabled = True
         
         self.fullscreen_action = QAction("Full Screen", self)
         self.fullscreen_action.setCheckable(True)
         self.fullscreen_action.toggled.connect(self.toggle_fullscreen)
-        self.fullscreen_action.toggled.connect(self.update_fullscreen_check_icon)
+        self.fullscreen_action.toggled.connect(functools.partial(self._set_check_icon, self.fullscreen_action))
 
         self.borderless_action = QAction("Borderless", self)
         self.borderless_action.setCheckable(True)
         self.borderless_action.toggled.connect(self.toggle_borderless)
-        self.borderless_action.toggled.connect(self.update_borderless_check_icon)
+        self.borderless_action.toggled.connect(functools.partial(self._set_check_icon, self.borderless_action))
 
         self.hide_controls_action = QAction("Hide Controls", self)
         self.hide_controls_action.setCheckable(True)
         self.hide_controls_action.toggled.connect(self.toggle_controls_visibility)
-        self.hide_controls_action.toggled.connect(self.update_hide_controls_check_icon)
+        self.hide_controls_action.toggled.connect(functools.partial(self._set_check_icon, self.hide_controls_action))
 
         self.update_mute_button_style()
         self.update_loop_button_style() 
-        self.update_mute_check_icon(False)
-        self.update_loop_check_icon(False)
-        self.update_auto_play_check_icon(False)
-        self.update_fullscreen_check_icon(False)
-        self.update_borderless_check_icon(False)
-        self.update_hide_controls_check_icon(False)
+        for action in (self.mute_action, self.loop_action, self.fullscreen_action,
+                self.borderless_action, self.hide_controls_action):
+            self._set_check_icon(action, False)
+        self._set_check_icon(self.auto_play_action, False, invert=True)
 
         self.select_play_action = QAction("Select Play Folder")
         self.select_play_action.triggered.connect(self.select_play_folder)
@@ -595,6 +981,22 @@ class VideoPlayer(QMainWindow):
 
         self.reload_action = QAction("Reload Folder")
         self.reload_action.triggered.connect(self.reload_current_folder)
+
+        # Build the context menu once; contextMenuEvent just execs it
+        self.context_menu = QMenu(self)
+        self.context_menu.addAction(self.mute_action)
+        self.context_menu.addAction(self.loop_action)
+        self.context_menu.addAction(self.auto_play_action)
+        self.context_menu.addAction(self.fullscreen_action)
+        self.context_menu.addAction(self.borderless_action)
+        self.context_menu.addAction(self.hide_controls_action)
+        self.context_menu.addSeparator()
+        self.context_menu.addAction(self.select_play_action)
+        self.context_menu.addAction(self.select_home_action)
+        #self.context_menu.addAction(self.reload_action) # refresh cache for current Play Folder
+        self.context_menu.addSeparator()
+        self.context_menu.addAction(self.open_action)
+        self.context_menu.addAction(self.save_action)
         
         self.controls.loop_btn.clicked.connect(self.toggle_loop)
         self.controls.mute_btn.clicked.connect(self.toggle_mute)
@@ -602,6 +1004,15 @@ class VideoPlayer(QMainWindow):
         self.controls.volume_slider.setValue(50)
         self.controls.orientation_dropdown.currentTextChanged.connect(self.controls.on_orientation_changed)
 
+        self._last_ctrl_geo = None
+        self._last_loading_geo = None
+
+        # Coalesce the flood of resize events from an interactive drag into
+        # one relayout per frame (~60Hz)
+        self._resize_throttle = QTimer()
+        self._resize_throttle.setSingleShot(True)
+        self._resize_throttle.setInterval(16)
+        self._resize_throttle.timeout.connect(self._apply_resize)
         self.update_overlay_position()
         self.controls.show()
         self.controls_visible = True
@@ -645,17 +1056,29 @@ class VideoPlayer(QMainWindow):
         x = geo.x()
         y = geo.y() + geo.height() - h
 
-        self.controls.setGeometry(x, y, w, h)
-        self.controls.raise_()
-        self.controls.show()
+        # These fire many times a second during a drag-move/resize; skip the
+        # setGeometry/raise_ churn when nothing actually moved
+        ctrl_geo = (x, y, w, h)
+        if ctrl_geo != self._last_ctrl_geo:
+            self.controls.setGeometry(x, y, w, h)
+            self.controls.raise_()
+            self.controls.show()
+            self._last_ctrl_geo = ctrl_geo
 
         if self.loading.isVisible():
-            self.loading.setGeometry(geo.x(), geo.y(), geo.width(), geo.height())
-            self.loading.raise_()
-            self.loading.show()
+            loading_geo = (geo.x(), geo.y(), geo.width(), geo.height())
+            if loading_geo != self._last_loading_geo:
+                self.loading.setGeometry(*loading_geo)
+                self.loading.raise_()
+                self.loading.show()
+                self._last_loading_geo = loading_geo
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        if not self._resize_throttle.isActive():
+            self._resize_throttle.start()
+
+    def _apply_resize(self):
         w, h = self.width(), self.height()
         
         geo = self.geometry()
@@ -684,88 +1107,107 @@ class VideoPlayer(QMainWindow):
         super().moveEvent(event)
         self.update_overlay_position()
 
-    def update_mute_check_icon(self, checked):
-        self.mute_action.setIcon(
-            self.check_box_filled_icon if checked else self.check_box_unfilled_icon)
-
-    def update_loop_check_icon(self, checked):
-        self.loop_action.setIcon(
-            self.check_box_filled_icon if checked else self.check_box_unfilled_icon)
-
-    def update_auto_play_check_icon(self, checked):
-        self.auto_play_action.setIcon(
-            self.check_box_unfilled_icon if checked else self.check_box_filled_icon)
-            
-    def update_fullscreen_check_icon(self, checked):
-        self.fullscreen_action.setIcon(
-            self.check_box_filled_icon if checked else self.check_box_unfilled_icon)
-
-    def update_borderless_check_icon(self, checked):
-        self.borderless_action.setIcon(
-            self.check_box_filled_icon if checked else self.check_box_unfilled_icon)
+    # One parameterized handler replaces the six per-action copies; invert
+    # covers auto-play, whose box shows unfilled when the option is on
+    def _set_check_icon(self, action, checked, invert=False):
+        action.setIcon(
+            self.check_box_filled_icon if checked != invert else self.check_box_unfilled_icon)
 
-    def update_hide_controls_check_icon(self, checked):
-        self.hide_controls_action.setIcon(
-            self.check_box_filled_icon if checked else self.check_box_unfilled_icon)
-        
     def contextMenuEvent(self, event):
-        menu = QMenu(self)
-        menu.setStyleSheet(stylesheet)
-
-        menu.addAction(self.mute_action)
-        menu.addAction(self.loop_action)
-        menu.addAction(self.auto_play_action)
-        menu.addAction(self.fullscreen_action)
-        menu.addAction(self.borderless_action)
-        menu.addAction(self.hide_controls_action)
-        menu.addSeparator()
-        menu.addAction(self.select_play_action)
-        menu.addAction(self.select_home_action)
-        #menu.addAction(self.reload_action) # refresh cache for current Play Folder
-        menu.addSeparator()
-        menu.addAction(self.open_action)
-        menu.addAction(self.save_action)
-
-        menu.exec(event.globalPos())
+        self.context_menu.exec(event.globalPos())
 
     def update_loader_progress(self, scanned, total):
         self.loading.update_loading_progress(scanned, total)
         self.loading.loading_progress_bar.setFormat(f"Loading {self.current_folder_name}: %p% ({scanned}/{total})")
 
-    def scan_folder(self, folder):
-        self.loader_timer = QTimer()
-        self.loader_timer.setSingleShot(True)
-        self.loader_timer.timeout.connect(self.show_loader)
+    def scan_folder(self, folder, force_reload=False):
+        # start() on an already-running single-shot timer restarts it, so
+        # the one timer from __init__ serves every scan
         self.loader_timer.start(1000)
 
-        self.scanner = VideoScanner(folder, self.controls.current_orientation, self.controls.current_max_length, force_reload=False)
+        # HDD users can drop probe_workers to 1-2 in the registry settings to
+        # avoid seek thrash; SSDs benefit from the full pool
+        try:
+            workers = int(self.settings.value("probe_workers", 0))
+        except (TypeError, ValueError):
+            workers = 0
+        # A folder picked mid-scan obsoletes the running scan; stop it and
+        # detach its signals so a late emit can't clobber the new queue
+        old = getattr(self, "scanner", None)
+        if old is not None and old.isRunning():
+            old.abort()
+            try:
+                old.scanned.disconnect(self.on_scan_complete)
+                old.scanned_progress.disconnect(self.update_loader_progress)
+            except TypeError:
+                pass
+
+        self.scanner = VideoScanner(folder, self.controls.current_orientation, self.controls.current_max_length,
+            force_reload=force_reload, cache=self.media_info_cache, workers=workers)
         self.scanner.scanned.connect(self.on_scan_complete)
         self.scanner.scanned_progress.connect(self.update_loader_progress)
         self.scanner.start()
 
-    def load_folder(self, folder):
+    def load_folder(self, folder, force_reload=False):
         self.loading_folder = True
         self.current_folder = folder
         self.current_folder_name = os.path.basename(folder)
         self.setWindowTitle(f"Random Video Player - {self.current_folder_name}")
         self.video_list = []
+        self._scanned_paths = None
 
-        self.scan_folder(folder)
+        self.scan_folder(folder, force_reload)
 
     def on_scan_complete(self, videos):
         self.loading_folder = False
+        self.media_info_cache = self.scanner.media_info_cache
+        self._scanned_paths = self.scanner.candidate_paths
         self.loader_timer.stop()
         self.loading.hide()
+        self._apply_video_list(videos)
+
+    def _apply_video_list(self, videos):
         self.video_list = videos
-        random.shuffle(self.video_list)
+        # QUrl parses and percent-encodes the path; build them once here
+        # instead of on every click
+        self._video_urls = [QUrl.fromLocalFile(p) for p in videos]
         print(Fore.GREEN + f"Found {len(videos)} videos." + Style.RESET_ALL)
         self.play_video()
 
+    # Orientation/length toggles only change the filter; the file list and
+    # metadata from the last scan are resident, so rebuild the queue in
+    # memory instead of re-walking the disk. Explicit reloads and folder
+    # switches still go through the scanner.
+    def _refilter_in_memory(self):
+        if not self._scanned_paths or not self.media_info_cache:
+            return False
+        want = self.controls.current_orientation
+        max_length = self.controls.current_max_length
+        cache = self.media_info_cache
+        videos = []
+        for p in self._scanned_paths:
+            info = cache.get(p)
+            if info is None:
+                return False
+            if want != "All" and info["orientation"] != want:
+                continue
+            if max_length != 0 and info["duration"] > max_length:
+                continue
+            videos.append(p)
+        random.shuffle(videos)
+        self._apply_video_list(videos)
+        return True
+
+    # Returns True when the refilter handled playback synchronously, so
+    # callers don't advance the freshly started queue a second time
     def load_folder_with_pending_settings(self):
         self.controls.current_orientation = self.controls.pending_orientation
         self.controls.current_max_length = self.controls.pending_max_length
+        if self._refilter_in_memory():
+            return True
         if self.current_folder and os.path.exists(self.current_folder):
             self.load_folder(self.current_folder)
+        return False
 
     def play_video(self):
         if not self.video_list:
@@ -778,28 +1220,111 @@ class VideoPlayer(QMainWindow):
         self.current_index = index
         path = self.video_list[index]
         self.current_video_path = path
-        url = QUrl.fromLocalFile(path)
-        self.mediaPlayer.setSource(url)
+        url = self._video_urls[index]
+        if self._standby_player.source() == url:
+            self._swap_players()
+        else:
+            self.mediaPlayer.setSource(url)
+        self._preload_next(index)
+        self._prefetch_next(index)
+
+    def _connect_player(self, player):
+        player.playbackStateChanged.connect(self._on_playback_state)
+        player.durationChanged.connect(self.controls.update_video_duration)
+        player.mediaStatusChanged.connect(self.media_finished)
+
+    def _disconnect_player(self, player):
+        player.playbackStateChanged.disconnect(self._on_playback_state)
+        player.durationChanged.disconnect(self.controls.update_video_duration)
+        player.mediaStatusChanged.disconnect(self.media_finished)
+
+    def _on_ui_tick(self):
+        self.controls.update_video_progress(self.mediaPlayer.position())
+
+    # Poll only while playing; one last tick on pause/stop so the frozen
+    # frame still shows its position
+    def _on_playback_state(self, state):
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self._ui_tick.start()
+        else:
+            self._ui_tick.stop()
+            self._on_ui_tick()
+
+    # Promote the preloaded standby player to active and demote the old one
+    def _swap_players(self):
+        self._disconnect_player(self.mediaPlayer)
+        self.mediaPlayer.stop()
+        self.mediaPlayer.setVideoOutput(None)
+        self.mediaPlayer.setAudioOutput(None)
+        self.mediaPlayer, self._standby_player = self._standby_player, self.mediaPlayer
+        self.mediaPlayer.setAudioOutput(self.audioOutput)
+        self.mediaPlayer.setVideoOutput(self.video_widget)
+        self._connect_player(self.mediaPlayer)
+        # durationChanged fired while the standby was disconnected and Qt
+        # won't re-emit it, so push the known duration to the controls here
+        self.controls.update_video_duration(self.mediaPlayer.duration())
+
+    # Hand the next queued source to the standby player a moment after the
+    # current one starts, so the two don't compete for startup I/O
+    def _preload_next(self, index):
+        if len(self.video_list) < 2:
+            return
+        next_url = self._video_urls[(index + 1) % len(self.video_list)]
+        QTimer.singleShot(500, lambda: self._standby_player.setSource(next_url))
+
+    # Warm the OS page cache with the next queued video's header while the
+    # current one plays, so next_video doesn't wait on a cold seek
+    def _prefetch_next(self, index):
+        if len(self.video_list) < 2:
+            return
+        path = self.video_list[(index + 1) % len(self.video_list)]
+        threading.Thread(target=self._prefetch_file, args=(path,), daemon=True).start()
+
+    @staticmethod
+    def _prefetch_file(path):
+        try:
+            if hasattr(os, "posix_fadvise"):
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 4 << 20, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            else:
+                # No readahead advice on Windows; touching the first MB has
+                # the same effect
+                with open(path, "rb") as f:
+                    f.read(1 << 20)
+        except OSError:
+            pass
 
     def next_video(self):
-        if (self.controls.pending_orientation != self.controls.current_orientation or
-            self.controls.pending_max_length != self.controls.current_max_length):
-            self.load_folder_with_pending_settings()
-            
+        # Runs on every video boundary; one attribute chain instead of four
+        c = self.controls
+        if (c.pending_orientation != c.current_orientation or
+            c.pending_max_length != c.current_max_length):
+            if self.load_folder_with_pending_settings():
+                return
+
         if not self.video_list:
             return
         self.current_index = (self.current_index + 1) % len(self.video_list)
+        # Reshuffle once the whole queue has been played, so every video is
+        # seen once per cycle with no repeats inside a cycle
+        if self.current_index == 0:
+            random.shuffle(self.video_list)
+            self._video_urls = [QUrl.fromLocalFile(p) for p in self.video_list]
         self.load_video(self.current_index)
-        if self.auto_play_enabled:
-            self.mediaPlayer.play()
-        else:
-            self.mediaPlayer.pause()
+        self._resume_or_pause()
 
     def previous_video(self):        
         if not self.video_list:
             return
         self.current_index = (self.current_index - 1) % len(self.video_list)
         self.load_video(self.current_index)
+        self._resume_or_pause()
+
+    # Single dispatch point for the post-navigation play/pause decision
+    def _resume_or_pause(self):
         if self.auto_play_enabled:
             self.mediaPlayer.play()
         else:
@@ -817,11 +1342,15 @@ class VideoPlayer(QMainWindow):
         self.update_loop_button_style()
             
     def update_loop_button_style(self):
-        if self.controls.loop_enabled:
-            self.controls.loop_btn.setIcon(QIcon(self.controls.loop_on_icon))
+        enabled = self.controls.loop_enabled
+        if enabled == self._last_loop_icon_state:
+            return
+        self._last_loop_icon_state = enabled
+        if enabled:
+            self.controls.loop_btn.setIcon(self.loop_on_qicon)
             self.loop_action.setIcon(self.check_box_filled_icon)
         else:
-            self.controls.loop_btn.setIcon(QIcon(self.controls.loop_off_icon))
+            self.controls.loop_btn.setIcon(self.loop_off_qicon)
             self.loop_action.setIcon(self.check_box_unfilled_icon)
 
     def toggle_auto_play(self):
@@ -838,27 +1367,46 @@ class VideoPlayer(QMainWindow):
             self.update_mute_button_style(0)
             self.controls.volume_slider.setValue(0)
 
+    # valueChanged fires for every integer step of a drag; coalesce to one
+    # audio/icon update per event-loop tick
     def update_volume(self, slider_value):        
+        if self._pending_volume is None:
+            QTimer.singleShot(0, self._apply_volume)
+        self._pending_volume = slider_value
+
+    def _apply_volume(self):
+        slider_value = self._pending_volume
+        self._pending_volume = None
+        if slider_value is None:
+            return
         volume_value = (slider_value / 100)
-        if slider_value == 0:
-            self.audioOutput.setMuted(True)
-        else:
-            self.audioOutput.setMuted(False)
-        self.audioOutput.setVolume(volume_value)
+        # Each setter round-trips into the audio backend and fans out
+        # signals, so skip the ones that wouldn't change anything
+        muted = slider_value == 0
+        if muted != self.audioOutput.isMuted():
+            self.audioOutput.setMuted(muted)
+        if abs(volume_value - self.audioOutput.volume()) > 1e-3:
+            self.audioOutput.setVolume(volume_value)
         self.update_mute_button_style(volume_value)
         
     def update_mute_button_style(self, volume_current = 50):        
-        if self.audioOutput.isMuted() or volume_current == 0:
-            self.controls.mute_btn.setIcon(QIcon(self.controls.volume_off_icon))
+        muted = self.audioOutput.isMuted() or volume_current == 0
+        if muted == self._last_mute_icon_state:
+            return
+        self._last_mute_icon_state = muted
+        if muted:
+            self.controls.mute_btn.setIcon(self.volume_off_qicon)
             self.mute_action.setIcon(self.check_box_filled_icon)
         else:
-            self.controls.mute_btn.setIcon(QIcon(self.controls.volume_on_icon))
+            self.controls.mute_btn.setIcon(self.volume_on_qicon)
             self.mute_action.setIcon(self.check_box_unfilled_icon)
 
     def seek_video(self):        
         if self.controls.duration_ms > 0:
-            pct = self.controls.progress_slider.value() / 1000
-            self.mediaPlayer.setPosition(int(self.controls.duration_ms * pct))
+            val = self.controls.progress_slider.value()
+            self.mediaPlayer.setPosition((self.controls.duration_ms * val) // 1000)
+            # The poll timer is stopped while paused, so refresh the label now
+            self._on_ui_tick()
 
     def media_finished(self, status):        
         if status == self.mediaPlayer.MediaStatus.EndOfMedia:
@@ -867,10 +1415,7 @@ class VideoPlayer(QMainWindow):
             else:
                 self.next_video()
 
-            if self.auto_play_enabled:
-                self.mediaPlayer.play()
-            else:
-                self.mediaPlayer.pause()
+            self._resume_or_pause()
 
     def toggle_fullscreen(self):        
         if self.isFullScreen():
@@ -927,45 +1472,52 @@ class VideoPlayer(QMainWindow):
             return
         path = os.path.abspath(self.video_list[self.current_index])
         if platform.system() == "Windows":
-            subprocess.Popen(['explorer', '/select,', path])
+            if not self._open_in_explorer_win(path):
+                subprocess.Popen(['explorer', '/select,', path])
         elif platform.system() == "Darwin":
             subprocess.Popen(["open", "-R", path])
         else:
             subprocess.Popen(["xdg-open", os.path.dirname(path)])
 
+    # SHOpenFolderAndSelectItems reuses the running shell process and an
+    # existing window for the folder instead of spawning a fresh explorer.exe
+    @staticmethod
+    def _open_in_explorer_win(path):
+        try:
+            import ctypes
+            ole32 = ctypes.windll.ole32
+            shell32 = ctypes.windll.shell32
+            ole32.CoInitialize(None)
+            pidl = ctypes.c_void_p()
+            sfgao = ctypes.c_ulong()
+            if shell32.SHParseDisplayName(
+                    ctypes.c_wchar_p(path), None,
+                    ctypes.byref(pidl), 0, ctypes.byref(sfgao)) != 0:
+                return False
+            try:
+                return shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0) == 0
+            finally:
+                ole32.CoTaskMemFree(pidl)
+        except (OSError, AttributeError):
+            return False
+
     def select_home_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Home Folder", self.home_folder)
         if folder:
             self.settings.setValue("home_folder", folder)
             self.home_folder = folder
 
-    # Remove items in the current folder from the cache json and rescan the folder. Can't do this if a folder is already loading
-    def reload_current_folder(self):  
+    # Rescan the current folder from scratch. The scanner reprobes every file
+    # (force_reload) and persists the refreshed entries itself, so no cache
+    # JSON is read or rewritten on the GUI thread. Can't do this if a folder is already loading
+    def reload_current_folder(self):
         if not self.current_folder:
             return
 
         if self.loading_folder:
             return
 
-        self.loading_folder = True
-
-        cache_path = get_cache_path()
-        if os.path.exists(cache_path):
-            with open(cache_path, "r") as f:
-                cache_data = json.load(f)
-        else:
-            cache_data = {}
-
-        folder = os.path.normpath(self.current_folder)
-        keys_to_remove = [k for k in list(cache_data.keys()) if os.path.normpath(k).startswith(folder)]
-
-        for k in keys_to_remove:
-            del cache_data[k]
-
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f)
-
-        self.scan_folder(folder)
+        self.load_folder(self.current_folder, force_reload=True)
         
     def save_current_video_as(self):        
         if not self.current_video_path:
@@ -986,35 +1538,95 @@ class VideoPlayer(QMainWindow):
         if not save_dir:
             return
 
+        # Reserve the destination atomically with O_EXCL: one syscall per
+        # candidate instead of a stat, and no exists-then-create race
         destination = save_file_path
         i = 1
-        while os.path.exists(destination):
-            destination = os.path.join(save_dir, f"{base} ({i}){ext}")
-            i += 1
-
+        while True:
+            try:
+                os.close(os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                break
+            except FileExistsError:
+                destination = os.path.join(save_dir, f"{base} ({i}){ext}")
+                i += 1
+            except OSError:
+                break
+
+        # The copy blocks for seconds on large files, so it runs on a worker
+        # thread along with the timestamp touch-up
+        threading.Thread(target=self._do_save, args=(source, destination), daemon=True).start()
+
+    def _do_save(self, source, destination):
         try:
-            shutil.copy(source, destination)
+            self._fastcopy(source, destination)
         except Exception as e:
             print(f"Save failed: {e}")
             return
 
+        # The old exiftool pass only transferred the creation date onto the
+        # modify date, which is a plain utime: st_ctime is the creation time
+        # on Windows, st_birthtime on macOS
         try:
-            subprocess.run(
-                [
-                    "exiftool",
-                    "-overwrite_original",
-                    "-F",
-                    "-FileModifyDate<FileCreateDate",
-                    destination
-                ],
-                shell=True
-            )
-        except Exception as e:
-            print(f"Exiftool failed: {e}")
+            st = os.stat(source)
+            created = getattr(st, "st_birthtime", None)
+            if created is None:
+                created = st.st_ctime if os.name == "nt" else st.st_mtime
+            os.utime(destination, (st.st_atime, created))
+        except OSError as e:
+            print(f"Timestamp transfer failed: {e}")
+
+    # shutil.copy streams through a small userspace buffer; prefer the
+    # platform's offload copy (server-side on SMB/NFS, CoW on btrfs) and fall
+    # back to a 1 MiB readinto loop
+    @staticmethod
+    def _fastcopy(src, dst):
+        if sys.platform == "win32":
+            import ctypes
+            # bFailIfExists=False: save_current_video_as already reserved dst
+            if ctypes.windll.kernel32.CopyFileW(
+                    ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), False):
+                return
+            raise OSError(f"CopyFileW failed ({ctypes.GetLastError()})")
+        if hasattr(os, "copy_file_range"):
+            in_fd = os.open(src, os.O_RDONLY)
+            out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                remaining = os.fstat(in_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(in_fd, out_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError as e:
+                # Cross-device or unsupported filesystem: use the plain loop
+                if e.errno not in (errno.EXDEV, errno.ENOSYS):
+                    raise
+            finally:
+                os.close(in_fd)
+                os.close(out_fd)
+        buf = bytearray(1 << 20)
+        mv = memoryview(buf)
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while (n := fsrc.readinto(mv)):
+                fdst.write(mv[:n])
+
+
+
+    def closeEvent(self, event):
+        self.settings.flush()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Default pixmap cache is 10 MB; bump it so rasterized icons never get
+    # evicted and re-rendered mid-session (the limit is in kilobytes)
+    QPixmapCache.setCacheLimit(51200)
+    # One app-wide stylesheet; Qt resolves the selector rules per widget, so
+    # the per-widget setStyleSheet(stylesheet) copies were redundant re-parses
+    app.setStyleSheet(stylesheet)
     player = VideoPlayer()
     player.show()
     sys.exit(app.exec())
\ No newline at end of file